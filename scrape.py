@@ -4,47 +4,70 @@
 import csv
 import os
 import re
-from collections import defaultdict
+import tempfile
+from collections import defaultdict, namedtuple
+from contextlib import contextmanager
 from datetime import date
+from string import Template
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
 
 URL = "https://www.dumscala.cz/cs/"
-DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "docs")
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+DOCS_DIR = os.path.join(BASE_DIR, "docs")
 CSV_PATH = os.path.join(DATA_DIR, "offices.csv")
 HTML_PATH = os.path.join(DOCS_DIR, "index.html")
 CSV_HEADER = ["date", "building", "offices", "m2"]
 
+# One parsed CSV record, with offices and m2 already converted to int
+Row = namedtuple("Row", CSV_HEADER)
+
 # Building names in order they appear on the page
 BUILDINGS = ["SCALA", "JAKUB"]
 
+# Strips thousands separators and units ("1 071 m²" -> "1071")
+_NON_DIGITS_RE = re.compile(r"\D+")
+
+# Shared HTTP session: keeps connections alive and retries transient upstream errors
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+))
+
 
 def scrape():
     """Scrape summary boxes and return list of dicts."""
     today = date.today().isoformat()
     try:
-        resp = requests.get(URL, timeout=30)
+        resp = _SESSION.get(URL, timeout=30)
         resp.raise_for_status()
     except Exception as e:
         print(f"Fetch failed: {e}")
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Lexbor decodes bytes as UTF-8 and ignores <meta charset>; dumscala.cz serves UTF-8
+    tree = LexborHTMLParser(resp.content)
 
     # Each building has a link <a href="/cs/dum-scala/"> (or dum-jakub) immediately
     # before a <p class="text-red"> summary with office count and m².
-    # We match each summary to its building via the nearest preceding link's href.
+    # We match each summary to its building via the nearest preceding link's href;
+    # a single selector query yields links and summaries together in document order.
     # Mapping from href slug to building name
     slug_to_building = {"dum-scala": "SCALA", "dum-jakub": "JAKUB"}
 
     found = {}
-    for p in soup.find_all("p", class_="text-red"):
-        link = p.find_previous("a", href=True)
-        if not link:
+    href = ""
+    for node in tree.css("a[href], p.text-red"):
+        if node.tag == "a":
+            href = node.attributes["href"] or ""
             continue
-        href = link["href"]
         building = None
         for slug, name in slug_to_building.items():
             if slug in href:
@@ -52,11 +75,11 @@ def scrape():
                 break
         if not building:
             continue
-        spans = p.find_all("span")
+        spans = node.css("span")
         if len(spans) >= 2:
             found[building] = {
-                "offices": int(re.sub(r"[^\d]", "", spans[0].get_text())),
-                "m2": int(re.sub(r"[^\d]", "", spans[1].get_text())),
+                "offices": int(_NON_DIGITS_RE.sub("", spans[0].text())),
+                "m2": int(_NON_DIGITS_RE.sub("", spans[1].text())),
             }
 
     rows = []
@@ -67,75 +90,55 @@ def scrape():
     return rows
 
 
+@contextmanager
+def _atomic_open(path, mode="w", **kwargs):
+    """Open a temp file next to path and move it over path on success."""
+    tmp = tempfile.NamedTemporaryFile(
+        mode, dir=os.path.dirname(path), delete=False, **kwargs
+    )
+    try:
+        with tmp:
+            yield tmp
+        # mkstemp creates 0600 files; keep outputs readable like a plain open() would
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
 def save_csv(rows):
     """Save rows to CSV, replacing any existing rows for the same date."""
     os.makedirs(DATA_DIR, exist_ok=True)
     today = rows[0]["date"] if rows else None
 
-    existing = []
-    if os.path.exists(CSV_PATH):
-        with open(CSV_PATH, newline="") as f:
-            existing = [r for r in csv.DictReader(f) if r["date"] != today]
-
-    with open(CSV_PATH, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADER)
-        writer.writeheader()
-        for row in existing:
-            writer.writerow(row)
+    # Stream old rows into a temp file next to the CSV, then swap it in atomically
+    with _atomic_open(CSV_PATH, newline="", suffix=".csv") as tmp:
+        writer = csv.writer(tmp)
+        writer.writerow(CSV_HEADER)
+        if os.path.exists(CSV_PATH):
+            with open(CSV_PATH, newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # header
+                for row in reader:
+                    if row and row[0] != today:
+                        writer.writerow(row)
         for row in rows:
-            writer.writerow(row)
+            writer.writerow([row[k] for k in CSV_HEADER])
 
 
 def read_csv():
-    """Read all CSV data, return list of dicts."""
+    """Read all CSV data, return list of Row tuples."""
     if not os.path.exists(CSV_PATH):
         return []
     with open(CSV_PATH, newline="") as f:
-        return list(csv.DictReader(f))
-
-
-def generate_report(all_data):
-    """Generate docs/index.html with Chart.js charts."""
-    os.makedirs(DOCS_DIR, exist_ok=True)
-
-    # Group by date
-    daily = defaultdict(dict)
-    for row in all_data:
-        daily[row["date"]][row["building"]] = {
-            "offices": int(row["offices"]),
-            "m2": int(row["m2"]),
-        }
-
-    dates = sorted(daily.keys())
-
-    zero = {"offices": 0, "m2": 0}
-    scala_m2 = [daily[d].get("SCALA", zero)["m2"] for d in dates]
-    jakub_m2 = [daily[d].get("JAKUB", zero)["m2"] for d in dates]
-    total_m2 = [s + j for s, j in zip(scala_m2, jakub_m2)]
-    scala_count = [daily[d].get("SCALA", zero)["offices"] for d in dates]
-    jakub_count = [daily[d].get("JAKUB", zero)["offices"] for d in dates]
-    total_count = [s + j for s, j in zip(scala_count, jakub_count)]
-
-    latest = dates[-1] if dates else None
-    current_scala = daily[latest].get("SCALA", zero) if latest else zero
-    current_jakub = daily[latest].get("JAKUB", zero) if latest else zero
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        return [Row(d, b, int(o), int(m)) for d, b, o, m in filter(None, reader)]
 
-    # History table rows
-    history_rows = ""
-    for d in reversed(dates):
-        sc = daily[d].get("SCALA", zero)
-        jk = daily[d].get("JAKUB", zero)
-        history_rows += f"""<tr>
-            <td>{d}</td>
-            <td>{sc['offices']}</td><td>{sc['m2']}</td>
-            <td>{jk['offices']}</td><td>{jk['m2']}</td>
-            <td>{sc['offices'] + jk['offices']}</td><td>{sc['m2'] + jk['m2']}</td>
-        </tr>\n"""
-
-    dates_js = str(dates)
-    today_str = latest or "\u2014"
 
-    html = f"""<!DOCTYPE html>
+# Static page shell for generate_report(), parsed once at import
+_REPORT_TEMPLATE = Template("""<!DOCTYPE html>
 <html lang="cs">
 <head>
 <meta charset="UTF-8">
@@ -146,7 +149,7 @@ def generate_report(all_data):
 <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600;700&family=Spectral:wght@400;600&display=swap" rel="stylesheet">
 <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
 <style>
-:root {{
+:root {
   --ink: #1b1e27;
   --muted: #566074;
   --accent: #e4572e;
@@ -156,9 +159,9 @@ def generate_report(all_data):
   --panel: rgba(255, 255, 255, 0.85);
   --border: rgba(27, 30, 39, 0.08);
   --shadow: 0 18px 50px rgba(19, 27, 45, 0.12);
-}}
-* {{ margin: 0; padding: 0; box-sizing: border-box; }}
-body {{
+}
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
   font-family: "Space Grotesk", system-ui, sans-serif;
   background:
     radial-gradient(1200px 500px at 10% -10%, rgba(58, 124, 165, 0.25), transparent 60%),
@@ -166,15 +169,15 @@ body {{
     linear-gradient(180deg, #f6f2ea 0%, #f1f5f7 100%);
   color: var(--ink);
   padding: 28px 18px 40px;
-}}
-main {{
+}
+main {
   max-width: 1100px;
   margin: 0 auto;
   display: flex;
   flex-direction: column;
   gap: 22px;
-}}
-header {{
+}
+header {
   background: var(--panel);
   border-radius: 18px;
   padding: 28px 30px;
@@ -182,25 +185,25 @@ header {{
   border: 1px solid var(--border);
   position: relative;
   overflow: hidden;
-}}
-header::after {{
+}
+header::after {
   content: "";
   position: absolute;
   inset: 0;
   background: linear-gradient(130deg, rgba(228, 87, 46, 0.12), transparent 45%);
   pointer-events: none;
-}}
-h1 {{
+}
+h1 {
   font-family: "Spectral", serif;
   font-size: clamp(2rem, 3vw, 2.6rem);
   margin-bottom: 6px;
-}}
-.subtitle {{
+}
+.subtitle {
   color: var(--muted);
   font-size: 1rem;
   max-width: 720px;
-}}
-.date-pill {{
+}
+.date-pill {
   display: inline-flex;
   align-items: center;
   gap: 8px;
@@ -211,16 +214,16 @@ h1 {{
   color: var(--ink);
   font-weight: 600;
   font-size: 0.95rem;
-}}
-.date-pill span {{
+}
+.date-pill span {
   color: var(--accent);
-}}
-.cards {{
+}
+.cards {
   display: grid;
   grid-template-columns: repeat(auto-fit, minmax(230px, 1fr));
   gap: 16px;
-}}
-.card {{
+}
+.card {
   background: var(--panel);
   border-radius: 16px;
   padding: 18px 20px;
@@ -228,119 +231,119 @@ h1 {{
   box-shadow: 0 14px 30px rgba(27, 30, 39, 0.08);
   position: relative;
   overflow: hidden;
-}}
-.card::before {{
+}
+.card::before {
   content: "";
   position: absolute;
   inset: 0;
   background: linear-gradient(160deg, rgba(255, 255, 255, 0.7), transparent 45%);
   pointer-events: none;
-}}
-.card h3 {{
+}
+.card h3 {
   font-size: 1.05rem;
   color: var(--muted);
   margin-bottom: 12px;
   letter-spacing: 0.04em;
   text-transform: uppercase;
-}}
-.metric {{
+}
+.metric {
   display: flex;
   align-items: baseline;
   gap: 10px;
   margin-bottom: 6px;
-}}
-.metric .value {{
+}
+.metric .value {
   font-size: 2.2rem;
   font-weight: 700;
-}}
-.metric .unit {{
+}
+.metric .unit {
   color: var(--muted);
   font-size: 0.95rem;
-}}
-.card .hint {{
+}
+.card .hint {
   color: var(--muted);
   font-size: 0.9rem;
-}}
-.panel {{
+}
+.panel {
   background: var(--panel);
   border-radius: 18px;
   padding: 20px 22px;
   border: 1px solid var(--border);
   box-shadow: var(--shadow);
-}}
-.panel h2 {{
+}
+.panel h2 {
   font-size: 1.2rem;
   margin-bottom: 10px;
-}}
-.grid {{
+}
+.grid {
   display: grid;
   gap: 18px;
-}}
-.grid.two {{
+}
+.grid.two {
   grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-}}
-details {{
+}
+details {
   background: var(--panel);
   border-radius: 18px;
   padding: 18px 22px;
   border: 1px solid var(--border);
   box-shadow: var(--shadow);
-}}
-summary {{
+}
+summary {
   cursor: pointer;
   font-weight: 600;
   font-size: 1.05rem;
   color: var(--ink);
   margin-bottom: 10px;
-}}
-table {{
+}
+table {
   width: 100%;
   border-collapse: collapse;
   font-size: 0.95rem;
-}}
-th, td {{
+}
+th, td {
   padding: 10px 12px;
   text-align: left;
   border-bottom: 1px solid rgba(27, 30, 39, 0.08);
-}}
-th {{
+}
+th {
   color: var(--muted);
   font-size: 0.85rem;
   text-transform: uppercase;
   letter-spacing: 0.05em;
-}}
-tbody tr:hover {{
+}
+tbody tr:hover {
   background: rgba(58, 124, 165, 0.06);
-}}
-footer {{
+}
+footer {
   text-align: center;
   color: var(--muted);
   font-size: 0.9rem;
   margin-top: 12px;
-}}
-footer a {{
+}
+footer a {
   color: var(--ink);
   text-decoration: none;
   border-bottom: 1px solid rgba(27, 30, 39, 0.3);
-}}
-@media (max-width: 720px) {{
-  header {{
+}
+@media (max-width: 720px) {
+  header {
     padding: 22px;
-  }}
-  .panel {{
+  }
+  .panel {
     padding: 18px;
-  }}
-}}
-.fade-in {{
+  }
+}
+.fade-in {
   animation: fadeIn 0.8s ease both;
-}}
-@keyframes fadeIn {{
-  from {{ opacity: 0; transform: translateY(12px); }}
-  to {{ opacity: 1; transform: translateY(0); }}
-}}
-@media (prefers-reduced-motion: reduce) {{
-  .fade-in {{ animation: none; }}
-}}
+}
+@keyframes fadeIn {
+  from { opacity: 0; transform: translateY(12px); }
+  to { opacity: 1; transform: translateY(0); }
+}
+@media (prefers-reduced-motion: reduce) {
+  .fade-in { animation: none; }
+}
 </style>
 </head>
 <body>
@@ -348,18 +351,18 @@ footer a {{
   <header class="fade-in">
     <h1>ScalaWatch</h1>
     <p class="subtitle">Přehled volných kanceláří v domech Scala a Jakub v Brně.</p>
-    <div class="date-pill">Poslední aktualizace <span>{today_str}</span></div>
+    <div class="date-pill">Poslední aktualizace <span>$today_str</span></div>
   </header>
 
   <section class="cards fade-in">
     <div class="card">
       <h3>Dům SCALA</h3>
       <div class="metric">
-        <span class="value">{current_scala['offices']}</span>
+        <span class="value">$scala_offices</span>
         <span class="unit">kanceláří</span>
       </div>
       <div class="metric">
-        <span class="value">{current_scala['m2']}</span>
+        <span class="value">$scala_m2</span>
         <span class="unit">m²</span>
       </div>
       <div class="hint">Dostupná plocha dnes</div>
@@ -367,11 +370,11 @@ footer a {{
     <div class="card">
       <h3>Dům JAKUB</h3>
       <div class="metric">
-        <span class="value">{current_jakub['offices']}</span>
+        <span class="value">$jakub_offices</span>
         <span class="unit">kanceláří</span>
       </div>
       <div class="metric">
-        <span class="value">{current_jakub['m2']}</span>
+        <span class="value">$jakub_m2</span>
         <span class="unit">m²</span>
       </div>
       <div class="hint">Dostupná plocha dnes</div>
@@ -379,11 +382,11 @@ footer a {{
     <div class="card">
       <h3>Celkem</h3>
       <div class="metric">
-        <span class="value">{current_scala['offices'] + current_jakub['offices']}</span>
+        <span class="value">$total_offices</span>
         <span class="unit">kanceláří</span>
       </div>
       <div class="metric">
-        <span class="value">{current_scala['m2'] + current_jakub['m2']}</span>
+        <span class="value">$total_m2</span>
         <span class="unit">m²</span>
       </div>
       <div class="hint">Oba domy dohromady</div>
@@ -411,7 +414,7 @@ footer a {{
       <th>Celkem kanceláří</th><th>Celkem m²</th>
     </tr></thead>
     <tbody>
-    {history_rows}
+    $history_rows
     </tbody>
     </table>
   </details>
@@ -424,60 +427,131 @@ footer a {{
 <script>
 Chart.defaults.font.family = '"Space Grotesk", system-ui, sans-serif';
 Chart.defaults.color = "#1b1e27";
-const dates = {dates_js};
-const scalaM2 = {scala_m2};
-const jakubM2 = {jakub_m2};
-const totalM2 = {total_m2};
-const scalaCount = {scala_count};
-const jakubCount = {jakub_count};
-const totalCount = {total_count};
-
-new Chart(document.getElementById('chartM2'), {{
+const dates = $dates_js;
+const scalaM2 = $scala_m2_js;
+const jakubM2 = $jakub_m2_js;
+const totalM2 = $total_m2_js;
+const scalaCount = $scala_count_js;
+const jakubCount = $jakub_count_js;
+const totalCount = $total_count_js;
+
+new Chart(document.getElementById('chartM2'), {
   type: 'line',
-  data: {{
+  data: {
     labels: dates,
     datasets: [
-      {{ label: 'SCALA m²', data: scalaM2, borderColor: '#e4572e', backgroundColor: 'rgba(228,87,46,0.12)', fill: true, tension: 0.2 }},
-      {{ label: 'JAKUB m²', data: jakubM2, borderColor: '#3a7ca5', backgroundColor: 'rgba(58,124,165,0.12)', fill: true, tension: 0.2 }},
-      {{ label: 'Celkem m²', data: totalM2, borderColor: '#2d936c', borderDash: [5, 5], fill: false, tension: 0.2 }},
+      { label: 'SCALA m²', data: scalaM2, borderColor: '#e4572e', backgroundColor: 'rgba(228,87,46,0.12)', fill: true, tension: 0.2 },
+      { label: 'JAKUB m²', data: jakubM2, borderColor: '#3a7ca5', backgroundColor: 'rgba(58,124,165,0.12)', fill: true, tension: 0.2 },
+      { label: 'Celkem m²', data: totalM2, borderColor: '#2d936c', borderDash: [5, 5], fill: false, tension: 0.2 },
     ]
-  }},
-  options: {{
+  },
+  options: {
     responsive: true,
-    plugins: {{ legend: {{ position: 'bottom', labels: {{ boxWidth: 12 }} }} }},
-    scales: {{
-      y: {{ beginAtZero: true, grid: {{ color: 'rgba(27, 30, 39, 0.08)' }}, title: {{ display: true, text: 'm²' }} }},
-      x: {{ grid: {{ display: false }} }}
-    }}
-  }}
-}});
-
-new Chart(document.getElementById('chartCount'), {{
+    plugins: { legend: { position: 'bottom', labels: { boxWidth: 12 } } },
+    scales: {
+      y: { beginAtZero: true, grid: { color: 'rgba(27, 30, 39, 0.08)' }, title: { display: true, text: 'm²' } },
+      x: { grid: { display: false } }
+    }
+  }
+});
+
+new Chart(document.getElementById('chartCount'), {
   type: 'line',
-  data: {{
+  data: {
     labels: dates,
     datasets: [
-      {{ label: 'SCALA', data: scalaCount, borderColor: '#e4572e', backgroundColor: 'rgba(228,87,46,0.12)', fill: true, tension: 0.2 }},
-      {{ label: 'JAKUB', data: jakubCount, borderColor: '#3a7ca5', backgroundColor: 'rgba(58,124,165,0.12)', fill: true, tension: 0.2 }},
-      {{ label: 'Celkem', data: totalCount, borderColor: '#2d936c', borderDash: [5, 5], fill: false, tension: 0.2 }},
+      { label: 'SCALA', data: scalaCount, borderColor: '#e4572e', backgroundColor: 'rgba(228,87,46,0.12)', fill: true, tension: 0.2 },
+      { label: 'JAKUB', data: jakubCount, borderColor: '#3a7ca5', backgroundColor: 'rgba(58,124,165,0.12)', fill: true, tension: 0.2 },
+      { label: 'Celkem', data: totalCount, borderColor: '#2d936c', borderDash: [5, 5], fill: false, tension: 0.2 },
     ]
-  }},
-  options: {{
+  },
+  options: {
     responsive: true,
-    plugins: {{ legend: {{ position: 'bottom', labels: {{ boxWidth: 12 }} }} }},
-    scales: {{
-      y: {{ beginAtZero: true, grid: {{ color: 'rgba(27, 30, 39, 0.08)' }}, title: {{ display: true, text: 'Počet kanceláří' }} }},
-      x: {{ grid: {{ display: false }} }}
-    }}
-  }}
-}});
+    plugins: { legend: { position: 'bottom', labels: { boxWidth: 12 } } },
+    scales: {
+      y: { beginAtZero: true, grid: { color: 'rgba(27, 30, 39, 0.08)' }, title: { display: true, text: 'Počet kanceláří' } },
+      x: { grid: { display: false } }
+    }
+  }
+});
 </script>
 </body>
-</html>"""
+</html>""")
 
 
-    with open(HTML_PATH, "w") as f:
-        f.write(html)
+def generate_report(all_data):
+    """Generate docs/index.html with Chart.js charts."""
+    os.makedirs(DOCS_DIR, exist_ok=True)
+
+    # Group by date
+    daily = defaultdict(dict)
+    for row in all_data:
+        daily[row.date][row.building] = row
+
+    zero = Row(None, None, 0, 0)
+    # Resolve each day's buildings once; both loops below reuse the pairs
+    days = [
+        (d, day.get("SCALA", zero), day.get("JAKUB", zero))
+        for d, day in sorted(daily.items())
+    ]
+    dates = [d for d, _, _ in days]
+
+    scala_m2, jakub_m2, total_m2 = [], [], []
+    scala_count, jakub_count, total_count = [], [], []
+    for _, sc, jk in days:
+        scala_m2.append(sc.m2)
+        jakub_m2.append(jk.m2)
+        total_m2.append(sc.m2 + jk.m2)
+        scala_count.append(sc.offices)
+        jakub_count.append(jk.offices)
+        total_count.append(sc.offices + jk.offices)
+
+    latest = dates[-1] if dates else None
+    current_scala = daily[latest].get("SCALA", zero) if latest else zero
+    current_jakub = daily[latest].get("JAKUB", zero) if latest else zero
+
+    # History table rows
+    history_parts = []
+    for d, sc, jk in reversed(days):
+        so, sm, jo, jm = sc.offices, sc.m2, jk.offices, jk.m2
+        history_parts.append(
+            f"<tr><td>{d}</td>"
+            f"<td>{so}</td><td>{sm}</td>"
+            f"<td>{jo}</td><td>{jm}</td>"
+            f"<td>{so + jo}</td><td>{sm + jm}</td></tr>\n"
+        )
+    history_rows = "".join(history_parts)
+
+    today_str = latest or "\u2014"
+
+    html = _REPORT_TEMPLATE.substitute(
+        today_str=today_str,
+        scala_offices=current_scala.offices,
+        scala_m2=current_scala.m2,
+        jakub_offices=current_jakub.offices,
+        jakub_m2=current_jakub.m2,
+        total_offices=current_scala.offices + current_jakub.offices,
+        total_m2=current_scala.m2 + current_jakub.m2,
+        history_rows=history_rows,
+        dates_js=orjson.dumps(dates).decode(),
+        scala_m2_js=orjson.dumps(scala_m2).decode(),
+        jakub_m2_js=orjson.dumps(jakub_m2).decode(),
+        total_m2_js=orjson.dumps(total_m2).decode(),
+        scala_count_js=orjson.dumps(scala_count).decode(),
+        jakub_count_js=orjson.dumps(jakub_count).decode(),
+        total_count_js=orjson.dumps(total_count).decode(),
+    )
+
+    # Leave the file (and its mtime) alone when nothing changed
+    data = html.encode("utf-8")
+    if os.path.exists(HTML_PATH):
+        with open(HTML_PATH, "rb") as f:
+            if f.read() == data:
+                print(f"Report unchanged at {HTML_PATH}")
+                return
+
+    with _atomic_open(HTML_PATH, "wb", suffix=".html") as tmp:
+        tmp.write(data)
     print(f"Report written to {HTML_PATH}")
 
 